@@ -105,6 +105,7 @@ class POPOApplicationRecorder(ApplicationRecorder, POPOAggregateRecorder):
         stop: Optional[int] = None,
         topics: Sequence[str] = (),
     ) -> List[Notification]:
+        topics_set = frozenset(topics)
         with self._database_lock:
             results = []
             i = start - 1
@@ -116,7 +117,7 @@ class POPOApplicationRecorder(ApplicationRecorder, POPOAggregateRecorder):
                 except IndexError:
                     break
                 i += 1
-                if topics and s.topic not in topics:
+                if topics_set and s.topic not in topics_set:
                     continue
                 n = Notification(
                     id=i,
@@ -304,7 +304,8 @@ class PostgresAggregateRecorder(AggregateRecorder):
             ".", "_"
         )
         self.select_events_statement = (
-            f"SELECT * FROM {self.events_table_name} WHERE originator_id = $1"
+            "SELECT originator_id, originator_version, topic, state "
+            f"FROM {self.events_table_name} WHERE originator_id = $1"
         )
         self.lock_statements: List[str] = []
 
@@ -582,7 +583,9 @@ class PostgresApplicationRecorder(PostgresAggregateRecorder, ApplicationRecorder
 
         params: List[Union[int, str, Sequence[str]]] = [start]
         statement = (
-            "SELECT * " f"FROM {self.events_table_name} " "WHERE notification_id>=$1 "
+            "SELECT notification_id, originator_id, originator_version, topic, state "
+            f"FROM {self.events_table_name} "
+            "WHERE notification_id>=$1 "
         )
         statement_name = f"select_notifications_{self.events_table_name}".replace(
             ".", "_"
@@ -955,6 +958,7 @@ class Factory(InfrastructureFactory):
             lock_timeout=lock_timeout,
             schema=schema,
         )
+        self._created_tables: Set[Tuple[str, ...]] = set()
 
     def aggregate_recorder(self, purpose: str = "events") -> AggregateRecorder:
         prefix = self.env.name.lower() or "stored"
@@ -966,7 +970,7 @@ class Factory(InfrastructureFactory):
             events_table_name=events_table_name,
         )
         if self.env_create_table():
-            recorder.create_table()
+            self._create_table(recorder)
         return recorder
 
     def application_recorder(self) -> ApplicationRecorder:
@@ -979,7 +983,7 @@ class Factory(InfrastructureFactory):
             events_table_name=events_table_name,
         )
         if self.env_create_table():
-            recorder.create_table()
+            self._create_table(recorder)
         return recorder
 
     def process_recorder(self) -> ProcessRecorder:
@@ -996,9 +1000,17 @@ class Factory(InfrastructureFactory):
             tracking_table_name=tracking_table_name,
         )
         if self.env_create_table():
-            recorder.create_table()
+            self._create_table(recorder)
         return recorder
 
+    def _create_table(self, recorder: PostgresAggregateRecorder) -> None:
+        # Only create tables once per factory, so that constructing
+        # more recorders for the same tables doesn't access the database.
+        statements = tuple(recorder.create_table_statements)
+        if statements not in self._created_tables:
+            recorder.create_table()
+            self._created_tables.add(statements)
+
     def env_create_table(self) -> bool:
         return strtobool(self.env.get(self.CREATE_TABLE) or "yes")
 
@@ -2,7 +2,17 @@ import sqlite3
 from contextlib import contextmanager
 from sqlite3 import Connection, Cursor
 from types import TracebackType
-from typing import Any, Iterator, List, Optional, Sequence, Type, Union
+from typing import (
+    Any,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 from uuid import UUID
 
 from eventsourcing.persistence import (
@@ -143,9 +153,11 @@ class SQLiteConnectionPool(ConnectionPool[SQLiteConnection]):
         pool_timeout: float = 5.0,
         max_age: Optional[float] = None,
         pre_ping: bool = False,
+        synchronous: Optional[str] = None,
     ):
         self.db_name = db_name
         self.lock_timeout = lock_timeout
+        self.synchronous = synchronous
         self.is_sqlite_memory_mode = self.detect_memory_mode(db_name)
         self.is_journal_mode_wal = False
         self.journal_mode_was_changed_to_wal = False
@@ -189,6 +201,11 @@ class SQLiteConnectionPool(ConnectionPool[SQLiteConnection]):
                     self.is_journal_mode_wal = True
                     self.journal_mode_was_changed_to_wal = True
 
+        # Set the synchronous flag, if configured. Otherwise
+        # SQLite will use its default, which is "FULL".
+        if self.synchronous is not None:
+            c.execute(f"PRAGMA synchronous={self.synchronous};")
+
         # Set the row factory.
         c.row_factory = sqlite3.Row
 
@@ -206,6 +223,7 @@ class SQLiteDatastore:
         pool_timeout: float = 5.0,
         max_age: Optional[float] = None,
         pre_ping: bool = False,
+        synchronous: Optional[str] = None,
     ):
         self.pool = SQLiteConnectionPool(
             db_name=db_name,
@@ -215,6 +233,7 @@ class SQLiteDatastore:
             pool_timeout=pool_timeout,
             max_age=max_age,
             pre_ping=pre_ping,
+            synchronous=synchronous,
         )
 
     @contextmanager
@@ -254,7 +273,9 @@ class SQLiteAggregateRecorder(AggregateRecorder):
             f"INSERT INTO {self.events_table_name} VALUES (?,?,?,?)"
         )
         self.select_events_statement = (
-            "SELECT * " f"FROM {self.events_table_name} " "WHERE originator_id=? "
+            "SELECT originator_id, originator_version, topic, state "
+            f"FROM {self.events_table_name} "
+            "WHERE originator_id=? "
         )
 
     def construct_create_table_statements(self) -> List[str]:
@@ -375,19 +396,23 @@ class SQLiteApplicationRecorder(
         stored_events: List[StoredEvent],
         **kwargs: Any,
     ) -> Optional[Sequence[int]]:
-        returning = []
-        for stored_event in stored_events:
-            c.execute(
-                self.insert_events_statement,
-                (
-                    stored_event.originator_id.hex,
-                    stored_event.originator_version,
-                    stored_event.topic,
-                    stored_event.state,
-                ),
+        super()._insert_events(c, stored_events, **kwargs)
+        # The first insert acquires the database write lock, which is held
+        # until the transaction ends, and each new row is given a rowid one
+        # larger than the largest rowid in the table. So the rowids of the
+        # inserted rows are contiguous, and can be calculated from the
+        # maximum rowid without selecting the rowid after each insert.
+        if stored_events:
+            last_notification_id = self._max_notification_id(c)
+            notification_ids = list(
+                range(
+                    last_notification_id - len(stored_events) + 1,
+                    last_notification_id + 1,
+                )
             )
-            returning.append(c.lastrowid)
-        return returning
+        else:
+            notification_ids = []
+        return notification_ids
 
     def select_notifications(
         self,
@@ -403,7 +428,11 @@ class SQLiteApplicationRecorder(
         notifications = []
 
         params: List[Union[int, str]] = [start]
-        statement = f"SELECT rowid, * FROM {self.events_table_name} " "WHERE rowid>=? "
+        statement = (
+            "SELECT rowid, originator_id, originator_version, topic, state "
+            f"FROM {self.events_table_name} "
+            "WHERE rowid>=? "
+        )
 
         if stop is not None:
             params.append(stop)
@@ -510,6 +539,9 @@ class SQLiteProcessRecorder(
 class Factory(InfrastructureFactory):
     SQLITE_DBNAME = "SQLITE_DBNAME"
     SQLITE_LOCK_TIMEOUT = "SQLITE_LOCK_TIMEOUT"
+    SQLITE_POOL_SIZE = "SQLITE_POOL_SIZE"
+    SQLITE_POOL_MAX_OVERFLOW = "SQLITE_POOL_MAX_OVERFLOW"
+    SQLITE_SYNCHRONOUS = "SQLITE_SYNCHRONOUS"
     CREATE_TABLE = "CREATE_TABLE"
 
     def __init__(self, env: Environment):
@@ -538,7 +570,53 @@ class Factory(InfrastructureFactory):
                     f"'{lock_timeout_str}'"
                 )
 
-        self.datastore = SQLiteDatastore(db_name=db_name, lock_timeout=lock_timeout)
+        pool_size_str = (self.env.get(self.SQLITE_POOL_SIZE) or "").strip() or "5"
+
+        try:
+            pool_size = int(pool_size_str)
+        except ValueError:
+            raise EnvironmentError(
+                f"SQLite environment value for key "
+                f"'{self.SQLITE_POOL_SIZE}' is invalid. "
+                f"If set, an int or empty string is expected: "
+                f"'{pool_size_str}'"
+            )
+
+        pool_max_overflow_str = (
+            self.env.get(self.SQLITE_POOL_MAX_OVERFLOW) or ""
+        ).strip() or "10"
+
+        try:
+            pool_max_overflow = int(pool_max_overflow_str)
+        except ValueError:
+            raise EnvironmentError(
+                f"SQLite environment value for key "
+                f"'{self.SQLITE_POOL_MAX_OVERFLOW}' is invalid. "
+                f"If set, an int or empty string is expected: "
+                f"'{pool_max_overflow_str}'"
+            )
+
+        synchronous_str = (self.env.get(self.SQLITE_SYNCHRONOUS) or "").strip()
+
+        synchronous: Optional[str] = None
+        if synchronous_str:
+            synchronous = synchronous_str.upper()
+            if synchronous not in ("OFF", "NORMAL", "FULL", "EXTRA"):
+                raise EnvironmentError(
+                    f"SQLite environment value for key "
+                    f"'{self.SQLITE_SYNCHRONOUS}' is invalid. "
+                    f"If set, 'OFF', 'NORMAL', 'FULL', 'EXTRA' or empty string "
+                    f"is expected: '{synchronous_str}'"
+                )
+
+        self.datastore = SQLiteDatastore(
+            db_name=db_name,
+            lock_timeout=lock_timeout,
+            pool_size=pool_size,
+            max_overflow=pool_max_overflow,
+            synchronous=synchronous,
+        )
+        self._created_tables: Set[Tuple[str, ...]] = set()
 
     def aggregate_recorder(self, purpose: str = "events") -> AggregateRecorder:
         events_table_name = "stored_" + purpose
@@ -547,21 +625,29 @@ class Factory(InfrastructureFactory):
             events_table_name=events_table_name,
         )
         if self.env_create_table():
-            recorder.create_table()
+            self._create_table(recorder)
         return recorder
 
     def application_recorder(self) -> ApplicationRecorder:
         recorder = SQLiteApplicationRecorder(datastore=self.datastore)
         if self.env_create_table():
-            recorder.create_table()
+            self._create_table(recorder)
         return recorder
 
     def process_recorder(self) -> ProcessRecorder:
         recorder = SQLiteProcessRecorder(datastore=self.datastore)
         if self.env_create_table():
-            recorder.create_table()
+            self._create_table(recorder)
         return recorder
 
+    def _create_table(self, recorder: SQLiteAggregateRecorder) -> None:
+        # Only create tables once per factory, so that constructing
+        # more recorders for the same tables doesn't access the database.
+        statements = tuple(recorder.create_table_statements)
+        if statements not in self._created_tables:
+            recorder.create_table()
+            self._created_tables.add(statements)
+
     def env_create_table(self) -> bool:
         default = "yes"
         return bool(strtobool(self.env.get(self.CREATE_TABLE, default) or default))
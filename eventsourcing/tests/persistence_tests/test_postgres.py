@@ -508,7 +508,8 @@ class TestPostgresAggregateRecorder(SetupPostgresDatastore, AggregateRecorderTes
         self.assertEqual(
             pg[0][1],
             (
-                f"PREPARE {select_alias} AS SELECT * FROM "
+                f"PREPARE {select_alias} AS SELECT originator_id, "
+                "originator_version, topic, state FROM "
                 f"{qualified_table_name} WHERE originator_id = $1 ORDER "
                 "BY originator_version ASC"
             ),
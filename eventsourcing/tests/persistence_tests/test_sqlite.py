@@ -1,7 +1,7 @@
 import sqlite3
 from sqlite3 import Connection
 from unittest import TestCase
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 from uuid import uuid4
 
 from eventsourcing.persistence import (
@@ -310,6 +310,12 @@ class TestSQLiteInfrastructureFactory(InfrastructureFactoryTestCase):
             del self.env[Factory.SQLITE_DBNAME]
         if Factory.SQLITE_LOCK_TIMEOUT in self.env:
             del self.env[Factory.SQLITE_LOCK_TIMEOUT]
+        if Factory.SQLITE_POOL_SIZE in self.env:
+            del self.env[Factory.SQLITE_POOL_SIZE]
+        if Factory.SQLITE_POOL_MAX_OVERFLOW in self.env:
+            del self.env[Factory.SQLITE_POOL_MAX_OVERFLOW]
+        if Factory.SQLITE_SYNCHRONOUS in self.env:
+            del self.env[Factory.SQLITE_SYNCHRONOUS]
 
     def test_construct_raises_environment_error_when_dbname_missing(self):
         del self.env[Factory.SQLITE_DBNAME]
@@ -343,6 +349,93 @@ class TestSQLiteInfrastructureFactory(InfrastructureFactoryTestCase):
         factory = Factory(self.env)
         self.assertEqual(factory.datastore.pool.lock_timeout, 10)
 
+    def test_creates_tables_once_per_factory(self):
+        factory = Factory(self.env)
+        with patch.object(SQLiteAggregateRecorder, "create_table") as create_table:
+            factory.application_recorder()
+            factory.application_recorder()
+            self.assertEqual(create_table.call_count, 1)
+
+            factory.process_recorder()
+            factory.process_recorder()
+            self.assertEqual(create_table.call_count, 2)
+
+            factory.aggregate_recorder("snapshots")
+            factory.aggregate_recorder("snapshots")
+            self.assertEqual(create_table.call_count, 3)
+
+    def test_environment_error_raised_when_pool_size_not_an_int(self):
+        self.env[Factory.SQLITE_POOL_SIZE] = "abc"
+        with self.assertRaises(EnvironmentError) as cm:
+            Factory(self.env)
+        self.assertEqual(
+            cm.exception.args[0],
+            "SQLite environment value for key 'SQLITE_POOL_SIZE' "
+            "is invalid. If set, an int or empty string is expected: 'abc'",
+        )
+
+    def test_pool_size_value(self):
+        factory = Factory(self.env)
+        self.assertEqual(factory.datastore.pool.pool_size, 5)
+
+        self.env[Factory.SQLITE_POOL_SIZE] = ""
+        factory = Factory(self.env)
+        self.assertEqual(factory.datastore.pool.pool_size, 5)
+
+        self.env[Factory.SQLITE_POOL_SIZE] = "2"
+        factory = Factory(self.env)
+        self.assertEqual(factory.datastore.pool.pool_size, 2)
+
+    def test_environment_error_raised_when_pool_max_overflow_not_an_int(self):
+        self.env[Factory.SQLITE_POOL_MAX_OVERFLOW] = "abc"
+        with self.assertRaises(EnvironmentError) as cm:
+            Factory(self.env)
+        self.assertEqual(
+            cm.exception.args[0],
+            "SQLite environment value for key 'SQLITE_POOL_MAX_OVERFLOW' "
+            "is invalid. If set, an int or empty string is expected: 'abc'",
+        )
+
+    def test_pool_max_overflow_value(self):
+        factory = Factory(self.env)
+        self.assertEqual(factory.datastore.pool.max_overflow, 10)
+
+        self.env[Factory.SQLITE_POOL_MAX_OVERFLOW] = ""
+        factory = Factory(self.env)
+        self.assertEqual(factory.datastore.pool.max_overflow, 10)
+
+        self.env[Factory.SQLITE_POOL_MAX_OVERFLOW] = "3"
+        factory = Factory(self.env)
+        self.assertEqual(factory.datastore.pool.max_overflow, 3)
+
+    def test_environment_error_raised_when_synchronous_not_valid(self):
+        self.env[Factory.SQLITE_SYNCHRONOUS] = "abc"
+        with self.assertRaises(EnvironmentError) as cm:
+            Factory(self.env)
+        self.assertEqual(
+            cm.exception.args[0],
+            "SQLite environment value for key 'SQLITE_SYNCHRONOUS' "
+            "is invalid. If set, 'OFF', 'NORMAL', 'FULL', 'EXTRA' or "
+            "empty string is expected: 'abc'",
+        )
+
+    def test_synchronous_value(self):
+        factory = Factory(self.env)
+        self.assertEqual(factory.datastore.pool.synchronous, None)
+
+        self.env[Factory.SQLITE_SYNCHRONOUS] = ""
+        factory = Factory(self.env)
+        self.assertEqual(factory.datastore.pool.synchronous, None)
+
+        self.env[Factory.SQLITE_SYNCHRONOUS] = "normal"
+        factory = Factory(self.env)
+        self.assertEqual(factory.datastore.pool.synchronous, "NORMAL")
+
+        # Check the value is used by connections (1 means "NORMAL").
+        with factory.datastore.transaction(commit=False) as c:
+            c.execute("PRAGMA synchronous;")
+            self.assertEqual(c.fetchone()[0], 1)
+
 
 del AggregateRecorderTestCase
 del ApplicationRecorderTestCase